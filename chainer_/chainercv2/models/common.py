@@ -2082,12 +2082,17 @@ class HeatmapMaxDetBlock(Chain):
         pts_x = (indices.array % in_size[1]) * scores_mask
         pts_y = (indices.array // in_size[1]) * scores_mask
         pts = F.concat((pts_x, pts_y, scores), axis=vector_dim).array
-        for b in range(batch):
-            for k in range(channels):
-                hm = heatmap[b, k, :, :].array
-                px = int(pts_x[b, k])
-                py = int(pts_y[b, k])
-                if (0 < px < in_size[1] - 1) and (0 < py < in_size[0] - 1):
-                    pts[b, k, 0] += np.sign(hm[py, px + 1] - hm[py, px - 1]) * 0.25
-                    pts[b, k, 1] += np.sign(hm[py + 1, px] - hm[py - 1, px]) * 0.25
+        if (in_size[0] < 3) or (in_size[1] < 3):
+            return pts
+        hm = heatmap.array
+        px = pts_x[:, :, 0].astype(np.int64)
+        py = pts_y[:, :, 0].astype(np.int64)
+        tune_mask = (0 < px) & (px < in_size[1] - 1) & (0 < py) & (py < in_size[0] - 1)
+        px = np.clip(px, 1, in_size[1] - 2)
+        py = np.clip(py, 1, in_size[0] - 2)
+        bi = np.arange(batch)[:, np.newaxis]
+        ki = np.arange(channels)[np.newaxis, :]
+        dx = hm[bi, ki, py, px + 1] - hm[bi, ki, py, px - 1]
+        dy = hm[bi, ki, py + 1, px] - hm[bi, ki, py - 1, px]
+        pts[:, :, :2] += np.sign(np.stack((dx, dy), axis=-1)) * 0.25 * tune_mask[:, :, np.newaxis]
         return pts
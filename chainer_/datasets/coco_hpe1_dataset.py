@@ -457,6 +457,18 @@ def get_affine_transform(center,
     dst_w = output_size[0]
     dst_h = output_size[1]
 
+    if rot == 0:
+        # Without rotation the transform is an isotropic scaling plus translation, so there is no need to solve for it:
+        src_center = center + scale_tmp * shift
+        dst_center = np.array([dst_w * 0.5, dst_h * 0.5])
+        if inv:
+            ratio = src_w / dst_w
+            offset = src_center - ratio * dst_center
+        else:
+            ratio = dst_w / src_w
+            offset = dst_center - ratio * src_center
+        return np.array([[ratio, 0.0, offset[0]], [0.0, ratio, offset[1]]])
+
     rot_rad = np.pi * rot / 180
     src_dir = get_dir([0, src_w * -0.5], rot_rad)
     dst_dir = np.array([0, dst_w * -0.5], np.float32)
@@ -649,20 +661,6 @@ def cv_cropBox(img, ul, br, resH, resW, pad_val=0):
 def recalc_pose1(keypoints,
                  bbs,
                  image_size):
-
-    def transform_preds(coords, center, scale, output_size):
-
-        def affine_transform(pt, t):
-            new_pt = np.array([pt[0], pt[1], 1.]).T
-            new_pt = np.dot(t, new_pt)
-            return new_pt[:2]
-
-        target_coords = np.zeros(coords.shape)
-        trans = get_affine_transform(center, scale, 0, output_size, inv=1)
-        for p in range(coords.shape[0]):
-            target_coords[p, 0:2] = affine_transform(coords[p, 0:2], trans)
-        return target_coords
-
     center = bbs[:, :2]
     scale = bbs[:, 2:4]
 
@@ -670,10 +668,12 @@ def recalc_pose1(keypoints,
     heatmap_width = image_size[1] // 4
     output_size = [heatmap_width, heatmap_height]
 
-    preds = np.zeros_like(keypoints)
-
-    for i in range(keypoints.shape[0]):
-        preds[i] = transform_preds(keypoints[i], center[i], scale[i], output_size)
+    batch = keypoints.shape[0]
+    trans_batch = np.array([get_affine_transform(center[i], scale[i], 0, output_size, inv=1) for i in range(batch)])
+    trans_batch = trans_batch.reshape((batch, 2, 3))
+    coords_xy1 = np.concatenate((keypoints[:, :, :2], np.ones(keypoints.shape[:2] + (1,), dtype=keypoints.dtype)),
+                                axis=2)
+    preds = np.einsum("nij,npj->npi", trans_batch, coords_xy1).astype(keypoints.dtype)
 
     return preds
 
@@ -690,25 +690,11 @@ def recalc_pose1b(pred,
     pred_score = pred[:, :, 2]
 
     pred[:, :, :2] = recalc_pose1(pred_keypoints, label_bbs, image_size)
-    pred_person_score = []
-
-    batch = pred_keypoints.shape[0]
-    num_joints = pred_keypoints.shape[1]
-    for idx in range(batch):
-        kpt_score = 0
-        count = 0
-        for i in range(num_joints):
-            mval = float(pred_score[idx][i])
-            if mval > visible_conf_threshold:
-                kpt_score += mval
-                count += 1
-
-        if count > 0:
-            kpt_score /= count
-
-        kpt_score = kpt_score * float(label_score[idx])
 
-        pred_person_score.append(kpt_score)
+    visible_mask = (pred_score > visible_conf_threshold)
+    visible_count = visible_mask.sum(axis=1)
+    kpt_score = np.where(visible_mask, pred_score, 0.0).astype(np.float64).sum(axis=1) / np.maximum(visible_count, 1)
+    pred_person_score = kpt_score * label_score.astype(np.float64)
 
     return pred, pred_person_score, label_img_id
 
@@ -764,25 +750,11 @@ def recalc_pose2b(pred,
     pred_score = pred[:, :, 2]
 
     pred[:, :, :2] = recalc_pose2(pred_keypoints, label_bbs, image_size)
-    pred_person_score = []
-
-    batch = pred_keypoints.shape[0]
-    num_joints = pred_keypoints.shape[1]
-    for idx in range(batch):
-        kpt_score = 0
-        count = 0
-        for i in range(num_joints):
-            mval = float(pred_score[idx][i])
-            if mval > visible_conf_threshold:
-                kpt_score += mval
-                count += 1
-
-        if count > 0:
-            kpt_score /= count
-
-        kpt_score = kpt_score * float(label_score[idx])
 
-        pred_person_score.append(kpt_score)
+    visible_mask = (pred_score > visible_conf_threshold)
+    visible_count = visible_mask.sum(axis=1)
+    kpt_score = np.where(visible_mask, pred_score, 0.0).astype(np.float64).sum(axis=1) / np.maximum(visible_count, 1)
+    pred_person_score = kpt_score * label_score.astype(np.float64)
 
     return pred, pred_person_score, label_img_id
 
@@ -382,8 +382,11 @@ class CocoDetValTransform(object):
         dst_w = output_size[0]
         dst_h = output_size[1]
 
-        rot_rad = np.pi * rot / 180
-        src_dir = CocoDetValTransform.get_rot_dir([0, src_w * -0.5], rot_rad)
+        if rot == 0:
+            src_dir = np.array([0, src_w * -0.5], np.float32)
+        else:
+            rot_rad = np.pi * rot / 180
+            src_dir = CocoDetValTransform.get_rot_dir([0, src_w * -0.5], rot_rad)
         dst_dir = np.array([0, dst_w * -0.5], np.float32)
 
         src = np.zeros((3, 2), dtype=np.float32)
@@ -464,9 +467,7 @@ class CocoDetValTransform(object):
         numpy.ndarray
             New bounding box with shape (1, 2).
         """
-        new_pt = np.array([pt[0], pt[1], 1.], dtype=np.float32).T
-        new_pt = np.dot(t, new_pt)
-        return new_pt[:2]
+        return t[:, 0] * pt[0] + t[:, 1] * pt[1] + t[:, 2]
 
 
 class Tuple(object):
@@ -95,6 +95,17 @@ class AlphaPose(HybridBlock):
             keypoints = self.heatmap_max_det(heatmap)
             return keypoints
 
+    def hybridize(self, active=True, **kwargs):
+        """
+        Hybridize the network body. The heatmap maximum detector is evaluated on host, so in keypoint mode only
+        the backbone and the decoder are hybridized, while the detector keeps running imperatively on their output.
+        """
+        if self.return_heatmap:
+            super(AlphaPose, self).hybridize(active, **kwargs)
+        else:
+            self.backbone.hybridize(active, **kwargs)
+            self.decoder.hybridize(active, **kwargs)
+
 
 def get_alphapose(backbone,
                   backbone_out_channels,
@@ -209,6 +220,11 @@ def _test():
         else:
             assert (y.shape[2] == 3)
 
+        net.hybridize(static_alloc=True, static_shape=True)
+        y_hybrid = net(x)
+        assert (y_hybrid.shape == y.shape)
+        assert np.allclose(y.asnumpy(), y_hybrid.asnumpy(), rtol=1e-3, atol=1e-4)
+
 
 if __name__ == "__main__":
     _test()
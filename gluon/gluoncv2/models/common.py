@@ -13,6 +13,7 @@ __all__ = ['round_channels', 'BreakBlock', 'get_activation_layer', 'ReLU6', 'PRe
 
 import math
 from inspect import isfunction
+import numpy as np
 import mxnet as mx
 from mxnet.gluon import nn, HybridBlock
 
@@ -2413,6 +2414,8 @@ class HeatmapMaxDetBlock(HybridBlock):
         # assert (not self.fixed_size) or (self.in_size == x.shape[2:])
         vector_dim = 2
         in_size = self.in_size if self.fixed_size else x.shape[2:]
+        if self.tune:
+            return self._calc_tuned_pts(x, in_size)
         heatmap_vector = x.reshape((0, 0, -3))
         indices = heatmap_vector.argmax(axis=vector_dim, keepdims=True)
         scores = heatmap_vector.max(axis=vector_dim, keepdims=True)
@@ -2420,18 +2423,48 @@ class HeatmapMaxDetBlock(HybridBlock):
         pts_x = (indices % in_size[1]) * scores_mask
         pts_y = (indices / in_size[1]).floor() * scores_mask
         pts = F.concat(pts_x, pts_y, scores, dim=vector_dim)
-        if self.tune:
-            batch = x.shape[0]
-            for b in range(batch):
-                for k in range(self.channels):
-                    hm = x[b, k, :, :]
-                    px = int(pts[b, k, 0].asscalar())
-                    py = int(pts[b, k, 1].asscalar())
-                    if (0 < px < in_size[1] - 1) and (0 < py < in_size[0] - 1):
-                        pts[b, k, 0] += (hm[py, px + 1] - hm[py, px - 1]).sign() * 0.25
-                        pts[b, k, 1] += (hm[py + 1, px] - hm[py - 1, px]).sign() * 0.25
         return pts
 
+    @staticmethod
+    def _calc_tuned_pts(x, in_size):
+        """
+        Detect heatmap maximums and tune point positions on host (imperative mode only).
+
+        Parameters:
+        ----------
+        x : NDArray
+            Heatmap tensor.
+        in_size : tuple of 2 int
+            Spatial size of the heatmap.
+
+        Returns:
+        -------
+        NDArray
+            Points with scores.
+        """
+        vector_dim = 2
+        heatmap = x.asnumpy()
+        batch, channels = heatmap.shape[:2]
+        heatmap_vector = heatmap.reshape((batch, channels, -1))
+        indices = heatmap_vector.argmax(axis=vector_dim)
+        scores = heatmap_vector.max(axis=vector_dim)
+        scores_mask = (scores > 0.0)
+        px = (indices % in_size[1]) * scores_mask
+        py = (indices // in_size[1]) * scores_mask
+        pts = np.stack((px, py, scores), axis=vector_dim).astype(np.float32)
+        if (in_size[0] < 3) or (in_size[1] < 3):
+            return mx.nd.array(pts, ctx=x.context)
+
+        tune_mask = (0 < px) & (px < in_size[1] - 1) & (0 < py) & (py < in_size[0] - 1)
+        center_indices = np.clip(py, 1, in_size[0] - 2) * in_size[1] + np.clip(px, 1, in_size[1] - 2)
+        neighbor_offsets = np.array([1, -1, in_size[1], -in_size[1]])
+        neighbor_indices = center_indices[:, :, np.newaxis] + neighbor_offsets
+        neighbors = np.take_along_axis(heatmap_vector, neighbor_indices, axis=vector_dim)
+        diffs = neighbors[:, :, 0::2] - neighbors[:, :, 1::2]
+        shifts = ((diffs > 0).astype(np.int8) - (diffs < 0).astype(np.int8)) * tune_mask[:, :, np.newaxis]
+        pts[:, :, :2] += 0.25 * shifts
+        return mx.nd.array(pts, ctx=x.context)
+
     def __repr__(self):
         s = "{name}(channels={channels}, in_size={in_size}, fixed_size={fixed_size})"
         return s.format(
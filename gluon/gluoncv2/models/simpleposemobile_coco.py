@@ -102,6 +102,17 @@ class SimplePoseMobile(HybridBlock):
             keypoints = self.heatmap_max_det(heatmap)
             return keypoints
 
+    def hybridize(self, active=True, **kwargs):
+        """
+        Hybridize the network body. The heatmap maximum detector is evaluated on host, so in keypoint mode only
+        the backbone and the decoder are hybridized, while the detector keeps running imperatively on their output.
+        """
+        if self.return_heatmap:
+            super(SimplePoseMobile, self).hybridize(active, **kwargs)
+        else:
+            self.backbone.hybridize(active, **kwargs)
+            self.decoder.hybridize(active, **kwargs)
+
 
 def get_simpleposemobile(backbone,
                          backbone_out_channels,
@@ -361,6 +372,15 @@ def _test():
         else:
             assert (y.shape[2] == 3)
 
+        net_kp = model(pretrained=pretrained, in_size=in_size, return_heatmap=False)
+        if not pretrained:
+            net_kp.initialize(ctx=ctx)
+        y_kp = net_kp(x)
+        net_kp.hybridize(static_alloc=True, static_shape=True)
+        y_kp_hybrid = net_kp(x)
+        assert (y_kp_hybrid.shape == (batch, keypoints, 3))
+        assert np.allclose(y_kp.asnumpy(), y_kp_hybrid.asnumpy(), rtol=1e-3, atol=1e-4)
+
 
 if __name__ == "__main__":
     _test()
@@ -265,9 +265,7 @@ def get_dir(src_point, rot_rad):
 
 
 def affine_transform(pt, t):
-    new_pt = np.array([pt[0], pt[1], 1.]).T
-    new_pt = np.dot(t, new_pt)
-    return new_pt[:2]
+    return t[:, 0] * pt[0] + t[:, 1] * pt[1] + t[:, 2]
 
 
 def fliplr_joints(joints, joints_vis, width, matched_parts):
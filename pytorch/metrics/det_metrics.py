@@ -222,6 +222,4 @@ class CocoDetMApMetric(mx.metric.EvalMetric):
         numpy.ndarray
             New bounding box with shape (1, 2).
         """
-        new_pt = np.array([pt[0], pt[1], 1.], dtype=np.float32).T
-        new_pt = np.dot(t, new_pt)
-        return new_pt[:2]
+        return t[:, 0] * pt[0] + t[:, 1] * pt[1] + t[:, 2]
@@ -2247,14 +2247,19 @@ class HeatmapMaxDetBlock(nn.Module):
         pts_x = (indices % in_size[1]) * scores_mask
         pts_y = (indices // in_size[1]) * scores_mask
         pts = torch.cat((pts_x, pts_y, scores), dim=vector_dim)
-        for b in range(batch):
-            for k in range(channels):
-                hm = heatmap[b, k, :, :]
-                px = int(pts[b, k, 0])
-                py = int(pts[b, k, 1])
-                if (0 < px < in_size[1] - 1) and (0 < py < in_size[0] - 1):
-                    pts[b, k, 0] += (hm[py, px + 1] - hm[py, px - 1]).sign() * 0.25
-                    pts[b, k, 1] += (hm[py + 1, px] - hm[py - 1, px]).sign() * 0.25
+        if (in_size[0] < 3) or (in_size[1] < 3):
+            return pts
+        px = pts_x.long()
+        py = pts_y.long()
+        tune_mask = ((px > 0) & (px < in_size[1] - 1) & (py > 0) & (py < in_size[0] - 1)).float()
+        center_indices = py.clamp(1, in_size[0] - 2) * in_size[1] + px.clamp(1, in_size[1] - 2)
+        neighbor_indices = torch.cat((
+            center_indices + 1,
+            center_indices - 1,
+            center_indices + in_size[1],
+            center_indices - in_size[1]), dim=vector_dim)
+        neighbors = heatmap_vector.gather(dim=vector_dim, index=neighbor_indices)
+        pts[:, :, :2] += (neighbors[:, :, 0::2] - neighbors[:, :, 1::2]).sign() * 0.25 * tune_mask
         return pts
 
     @staticmethod
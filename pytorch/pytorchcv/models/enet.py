@@ -41,10 +41,15 @@ class ENetMaxDownBlock(nn.Module):
 
     def forward(self, x):
         x, max_indices = self.pool(x)
-        branch, _, height, width = x.size()
-        pad = torch.zeros(branch, self.ext_channels, height, width, dtype=x.dtype, device=x.device)
-        x = torch.cat((x, pad), dim=1)
-        return x, max_indices
+        branch, channels, height, width = x.size()
+        out_size = (branch, channels + self.ext_channels, height, width)
+        if hasattr(torch, "channels_last") and x.is_contiguous(memory_format=torch.channels_last):
+            out = torch.empty(out_size, dtype=x.dtype, device=x.device, memory_format=torch.channels_last)
+        else:
+            out = x.new_empty(out_size)
+        out[:, :channels] = x
+        out[:, channels:] = 0
+        return out, max_indices
 
 
 class ENetUpBlock(nn.Module):
@@ -197,6 +202,7 @@ class ENetUnit(nn.Module):
             out_channels=out_channels,
             bias=bias,
             activation=activation)
+        self.use_dropout = (dropout_rate > 0.0)
         self.dropout = nn.Dropout2d(p=dropout_rate)
         self.activ = activation()
 
@@ -211,7 +217,8 @@ class ENetUnit(nn.Module):
         x = self.conv1(x)
         x = self.conv2(x)
         x = self.conv3(x)
-        x = self.dropout(x)
+        if self.use_dropout and self.training:
+            x = self.dropout(x)
 
         x = x + identity
         x = self.activ(x)
@@ -59,10 +59,15 @@ class DownBlock(nn.Module):
 
     def forward(self, x):
         x, max_indices = self.pool(x)
-        branch, _, height, width = x.size()
-        pad = torch.zeros(branch, self.ext_channels, height, width, dtype=x.dtype, device=x.device)
-        x = torch.cat((x, pad), dim=1)
-        return x, max_indices
+        branch, channels, height, width = x.size()
+        out_size = (branch, channels + self.ext_channels, height, width)
+        if hasattr(torch, "channels_last") and x.is_contiguous(memory_format=torch.channels_last):
+            out = torch.empty(out_size, dtype=x.dtype, device=x.device, memory_format=torch.channels_last)
+        else:
+            out = x.new_empty(out_size)
+        out[:, :channels] = x
+        out[:, channels:] = 0
+        return out, max_indices
 
 
 class UpBlock(nn.Module):
@@ -175,6 +180,7 @@ class ENetUnit(nn.Module):
             out_channels=out_channels,
             bias=bias,
             activation=activation)
+        self.use_dropout = (dropout_rate > 0.0)
         self.dropout = nn.Dropout2d(p=dropout_rate)
         self.activ = activation()
 
@@ -189,7 +195,8 @@ class ENetUnit(nn.Module):
         x = self.conv1(x)
         x = self.conv2(x)
         x = self.conv3(x)
-        x = self.dropout(x)
+        if self.use_dropout and self.training:
+            x = self.dropout(x)
 
         x = x + identity
         x = self.activ(x)
@@ -311,15 +318,38 @@ class ENet(nn.Module):
             output_padding=1,
             bias=False)
 
+        self.channels_last = hasattr(torch, "channels_last")
+        if self.channels_last:
+            self.to(memory_format=torch.channels_last)
+
     def forward(self, x):
+        if self.channels_last:
+            x = x.contiguous(memory_format=torch.channels_last)
         x = self.steam(x)
         x, max_indices1 = self.stage1(x)
         x, max_indices2 = self.stage2(x)
         x = self.stage3(x, max_indices2)
         x = self.stage4(x, max_indices1)
         x = self.head(x)
+        if self.channels_last:
+            x = x.contiguous()
         return x
 
+    def fuse_model(self):
+        """
+        Fold batch normalization (and the following ReLU) into the preceding convolution of each ConvBlock for
+        inference.
+        """
+        assert (not self.training)
+        conv_blocks = [module for module in self.modules() if isinstance(module, ConvBlock)]
+        for block in conv_blocks:
+            if block.use_bn:
+                modules_to_fuse = ["conv", "bn"]
+                if block.activate and isinstance(block.activ, nn.ReLU):
+                    modules_to_fuse.append("activ")
+                torch.quantization.fuse_modules(block, modules_to_fuse, inplace=True)
+        return self
+
 
 def oth_enet_cityscapes(num_classes=19, pretrained=False, **kwargs):
     return ENet(num_classes=num_classes, **kwargs)
@@ -366,6 +396,10 @@ def _test():
         # y.sum().backward()
         assert (tuple(y.size()) == (batch, classes, in_size[0], in_size[1]))
 
+        net.fuse_model()
+        y_fused = net(x)
+        assert torch.allclose(y, y_fused, rtol=1e-3, atol=1e-4)
+
 
 if __name__ == "__main__":
     _test()
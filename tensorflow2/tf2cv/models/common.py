@@ -3337,16 +3337,20 @@ class HeatmapMaxDetBlock(nn.Layer):
         scores_mask = tf.cast(tf.math.greater(scores, 0.0), np.float32)
         pts_x = (indices % in_size[1]) * scores_mask
         pts_y = (indices // in_size[1]) * scores_mask
+        if self.tune and (in_size[0] >= 3) and (in_size[1] >= 3):
+            px = tf.cast(pts_x, np.int32)
+            py = tf.cast(pts_y, np.int32)
+            tune_mask = tf.cast((px > 0) & (px < in_size[1] - 1) & (py > 0) & (py < in_size[0] - 1), np.float32)
+            center_indices = tf.clip_by_value(py, 1, in_size[0] - 2) * in_size[1] +\
+                tf.clip_by_value(px, 1, in_size[1] - 2)
+            neighbor_indices = tf.concat([
+                center_indices + 1,
+                center_indices - 1,
+                center_indices + in_size[1],
+                center_indices - in_size[1]], axis=vector_dim)
+            neighbors = tf.gather(heatmap_vector, neighbor_indices, batch_dims=2)
+            shifts = tf.math.sign(neighbors[:, :, 0::2] - neighbors[:, :, 1::2]) * 0.25 * tune_mask
+            pts_x += shifts[:, :, 0:1]
+            pts_y += shifts[:, :, 1:2]
         pts = tf.concat([pts_x, pts_y, scores], axis=vector_dim)
-        if self.tune:
-            pts = pts.numpy()
-            for b in range(batch):
-                for k in range(channels):
-                    hm = x[b, k, :, :] if is_channels_first(self.data_format) else x[b, :, :, k]
-                    px = int(pts[b, k, 0])
-                    py = int(pts[b, k, 1])
-                    if (0 < px < in_size[1] - 1) and (0 < py < in_size[0] - 1):
-                        pts[b, k, 0] += np.sign(hm[py, px + 1] - hm[py, px - 1]) * 0.25
-                        pts[b, k, 1] += np.sign(hm[py + 1, px] - hm[py - 1, px]) * 0.25
-            pts = tf.convert_to_tensor(pts)
         return pts